@@ -1,20 +1,42 @@
 from __future__ import annotations
 
 import argparse
+import bz2
 import csv
+import gzip
+import io
+import lzma
+import time
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import BinaryIO, Dict, Iterator, Tuple
 
 from sqlalchemy import text
 
 from app.config import get_engine, ensure_schema
 
+try:  # optional: zstd support only when the zstandard package is installed
+    import zstandard
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None
+
+# Large read buffer so the decompressor and CSV parser see few, big reads
+READ_BUFFER_SIZE = 1 << 20
+
+# Magic bytes → compression format; the file content decides, not its suffix
+_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+)
+
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Aggregate sailing-level CSV into weekly corridor capacity")
-    p.add_argument("--csv", required=False, default="sailing_level_raw.csv", help="Path to sailing_level_raw.csv")
+    p.add_argument("--csv", required=False, default="sailing_level_raw.csv", help="Path to sailing_level_raw.csv (optionally .gz/.bz2/.xz/.zst)")
     p.add_argument("--truncate", action="store_true", help="Delete all from weekly_capacity before loading")
     return p.parse_args()
 
@@ -24,7 +46,93 @@ def week_start(d: datetime) -> datetime.date:
     return (d - timedelta(days=d.weekday())).date()
 
 
-def aggregate(csv_path: Path) -> Dict[Tuple[str, datetime.date], int]:
+class _CountingReader(io.RawIOBase):
+    """Binary stream wrapper that counts the bytes read through it."""
+
+    def __init__(self, raw: BinaryIO) -> None:
+        self._raw = raw
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        data = self._raw.read(len(b))
+        n = len(data)
+        b[:n] = data
+        self.bytes_read += n
+        return n
+
+
+def detect_compression(path: Path) -> str | None:
+    """Return 'gzip', 'bz2', 'xz', 'zstd' or None (plain text) from the file's magic bytes."""
+    with path.open("rb") as f:
+        head = f.read(6)
+    for magic, fmt in _MAGIC:
+        if head.startswith(magic):
+            return fmt
+    return None
+
+
+@contextmanager
+def open_csv(csv_path: Path, stats: Dict[str, object] | None = None) -> Iterator[io.TextIOBase]:
+    """Open csv_path as text, stream-decompressing gzip/bz2/xz/zstd input on the fly.
+
+    If stats is given it is filled on exit with the compression format, the
+    compressed (on-disk) and uncompressed byte counts and the elapsed seconds.
+    """
+    fmt = detect_compression(csv_path)
+    if fmt == "zstd" and zstandard is None:
+        raise SystemExit(f"{csv_path} is zstd-compressed; install the 'zstandard' package to read it.")
+
+    started = time.perf_counter()
+    with csv_path.open("rb", buffering=READ_BUFFER_SIZE) as fh:
+        compressed = _CountingReader(fh)
+        if fmt == "gzip":
+            stream = gzip.GzipFile(fileobj=compressed, mode="rb")
+        elif fmt == "bz2":
+            stream = bz2.BZ2File(compressed, mode="rb")
+        elif fmt == "xz":
+            stream = lzma.LZMAFile(compressed, mode="rb")
+        elif fmt == "zstd":
+            stream = zstandard.ZstdDecompressor().stream_reader(
+                compressed, read_size=READ_BUFFER_SIZE, read_across_frames=True
+            )
+        else:
+            stream = compressed
+        uncompressed = _CountingReader(stream)
+        buffered = io.BufferedReader(uncompressed, buffer_size=READ_BUFFER_SIZE)
+        text_stream = io.TextIOWrapper(buffered, encoding="utf-8", newline="")
+        try:
+            yield text_stream
+        finally:
+            text_stream.close()
+            if stream is not compressed:
+                stream.close()
+            if stats is not None:
+                stats.update(
+                    format=fmt or "plain",
+                    compressed_bytes=compressed.bytes_read,
+                    uncompressed_bytes=uncompressed.bytes_read,
+                    seconds=time.perf_counter() - started,
+                )
+
+
+def format_throughput(stats: Dict[str, object]) -> str:
+    """Human-readable compressed vs. uncompressed read rates from open_csv stats."""
+    secs = max(float(stats["seconds"]), 1e-9)
+    mb = 1024 * 1024
+    compressed_mb = float(stats["compressed_bytes"]) / mb
+    uncompressed_mb = float(stats["uncompressed_bytes"]) / mb
+    return (
+        f"{stats['format']}: read {compressed_mb:.1f} MiB compressed "
+        f"({compressed_mb / secs:.1f} MiB/s), "
+        f"{uncompressed_mb:.1f} MiB uncompressed "
+        f"({uncompressed_mb / secs:.1f} MiB/s) in {secs:.2f}s"
+    )
+
+
+def aggregate(csv_path: Path, stats: Dict[str, object] | None = None) -> Dict[Tuple[str, datetime.date], int]:
     """Aggregate per (corridor, week_start_date) using sailing-level rows.
 
     Expects columns: ORIGIN, DESTINATION, ORIGIN_AT_UTC, OFFERED_CAPACITY_TEU.
@@ -33,9 +141,12 @@ def aggregate(csv_path: Path) -> Dict[Tuple[str, datetime.date], int]:
       - service_version_and_roundtrip_identfiers
       - origin_service_version_and_master
       - destination_service_version_and_master
+
+    Compressed input (.gz, .bz2, .xz, .zst) is decompressed while streaming;
+    pass a dict as stats to receive the read statistics from open_csv.
     """
     agg: Dict[Tuple[str, datetime.date], int] = defaultdict(int)
-    with csv_path.open(newline="", encoding="utf-8") as f:
+    with open_csv(csv_path, stats) as f:
         reader = csv.DictReader(f)
         rows = list(reader)
 
@@ -131,7 +242,9 @@ def main() -> None:
     csv_path = Path(args.csv)
     if not csv_path.exists():
         raise SystemExit(f"CSV not found at {csv_path}. Provide --csv PATH or place sailing_level_raw.csv in repo root.")
-    agg = aggregate(csv_path)
+    stats: Dict[str, object] = {}
+    agg = aggregate(csv_path, stats)
+    print(f"Read {csv_path} ({format_throughput(stats)})")
     load_data(agg, truncate=args.truncate)
     print(f"Loaded {len(agg)} weekly rows from {csv_path}")
 
@@ -0,0 +1,58 @@
+import bz2
+import gzip
+import lzma
+from datetime import date
+
+import pytest
+
+from scripts.load_weekly_capacity import aggregate, detect_compression
+
+CSV = (
+    "ORIGIN,DESTINATION,ORIGIN_AT_UTC,OFFERED_CAPACITY_TEU\n"
+    "ASIA,EUR,2024-01-02 10:00:00.000,100\n"
+    "ASIA,EUR,2024-01-04 10:00:00,50\n"
+    "ASIA,EUR,2024-01-09 10:00:00,70\n"
+).encode("utf-8")
+
+
+def zstd_two_frames(data):
+    zstandard = pytest.importorskip("zstandard")
+    cctx = zstandard.ZstdCompressor()
+    mid = data.index(b"\n", len(data) // 2) + 1
+    return cctx.compress(data[:mid]) + cctx.compress(data[mid:])
+
+
+@pytest.mark.parametrize(
+    "suffix, compress, fmt",
+    [
+        (".csv", lambda b: b, None),
+        (".csv.gz", gzip.compress, "gzip"),
+        (".csv.bz2", bz2.compress, "bz2"),
+        (".csv.xz", lzma.compress, "xz"),
+        (".csv.zst", zstd_two_frames, "zstd"),
+    ],
+)
+def test_aggregate_reads_compressed_input(tmp_path, suffix, compress, fmt):
+    path = tmp_path / f"sailings{suffix}"
+    path.write_bytes(compress(CSV))
+    assert detect_compression(path) == fmt
+
+    stats = {}
+    agg = aggregate(path, stats)
+    assert agg == {("ASIA-EUR", date(2024, 1, 1)): 150, ("ASIA-EUR", date(2024, 1, 8)): 70}
+    assert stats["format"] == (fmt or "plain")
+    assert stats["uncompressed_bytes"] == len(CSV)
+    assert stats["compressed_bytes"] == path.stat().st_size
+
+
+def test_detect_compression_prefers_magic_over_suffix(tmp_path):
+    path = tmp_path / "mislabelled.csv"
+    path.write_bytes(gzip.compress(CSV))
+    assert detect_compression(path) == "gzip"
+
+
+def test_plain_file_with_compressed_suffix_is_read_as_text(tmp_path):
+    path = tmp_path / "plain.csv.gz"
+    path.write_bytes(CSV)
+    assert detect_compression(path) is None
+    assert aggregate(path) == {("ASIA-EUR", date(2024, 1, 1)): 150, ("ASIA-EUR", date(2024, 1, 8)): 70}